@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import Any, Self
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from safir.logging import LogLevel, Profile
 
-__all__ = ["Config", "config"]
+__all__ = ["Config", "config", "get_config"]
 
 
 class Config(BaseSettings):
@@ -27,9 +30,48 @@ class Config(BaseSettings):
     )
 
     model_config = SettingsConfigDict(
-        env_prefix="WIRNN_SERVICE_", case_sensitive=False
+        env_prefix="WIRNN_SERVICE_", case_sensitive=False, frozen=True
     )
 
+    @classmethod
+    def for_test(cls, **overrides: Any) -> Self:
+        """Construct a test configuration without reading the environment.
+
+        Validation is skipped, so any overrides must already have the correct
+        types. The result only takes effect where it is injected in place of
+        the ``get_config`` dependency, so it changes what handlers see. It
+        does not change the path prefix, documentation URLs, or logging
+        configuration, which `wirnnservice.main` sets from ``config`` at
+        import time.
+
+        Parameters
+        ----------
+        **overrides
+            Values for configuration fields. Fields not given are set to their
+            defaults.
+
+        Returns
+        -------
+        Config
+            Configuration built from the defaults and the overrides.
+        """
+        return cls.model_construct(**overrides)
+
+
+@lru_cache
+def get_config() -> Config:
+    """Return the configuration for wirnn-service.
+
+    The configuration is parsed from the environment on the first call and
+    the same frozen instance is returned thereafter.
+    """
+    return Config()
+
+
+config = get_config()
+"""Configuration for wirnn-service.
 
-config = Config()
-"""Configuration for wirnn-service."""
+Used at import time by `wirnnservice.main` to build the application and set
+up logging. Handlers should depend on `get_config` instead so that tests can
+override it.
+"""
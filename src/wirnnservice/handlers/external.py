@@ -7,7 +7,7 @@ from safir.dependencies.logger import logger_dependency
 from safir.metadata import get_metadata
 from structlog.stdlib import BoundLogger
 
-from ..config import config
+from ..config import Config, get_config
 from ..models import Index
 
 __all__ = ["get_index", "external_router"]
@@ -27,6 +27,7 @@ external_router = APIRouter()
     summary="Application metadata",
 )
 async def get_index(
+    config: Annotated[Config, Depends(get_config)],
     logger: Annotated[BoundLogger, Depends(logger_dependency)],
 ) -> Index:
     """GET ``/wirnn-service/`` (the app's external root).
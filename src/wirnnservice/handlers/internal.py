@@ -8,10 +8,12 @@ These handlers should be used for monitoring, health checks, internal status,
 or other information that should not be visible outside the Kubernetes cluster.
 """
 
-from fastapi import APIRouter
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
 from safir.metadata import Metadata, get_metadata
 
-from ..config import config
+from ..config import Config, get_config
 
 __all__ = ["get_index", "internal_router"]
 
@@ -31,7 +33,9 @@ internal_router = APIRouter()
     response_model_exclude_none=True,
     summary="Application metadata",
 )
-async def get_index() -> Metadata:
+async def get_index(
+    config: Annotated[Config, Depends(get_config)],
+) -> Metadata:
     """GET ``/`` (the app's internal root).
 
     By convention, this endpoint returns only the application's metadata.
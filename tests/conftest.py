@@ -4,27 +4,65 @@ from __future__ import annotations
 
 from collections.abc import AsyncIterator
 
+import pytest
 import pytest_asyncio
 from asgi_lifespan import LifespanManager
 from fastapi import FastAPI
-from httpx import AsyncClient
+from httpx import ASGITransport, AsyncClient
+from pytest_asyncio import is_async_test
 
 from wirnnservice import main
+from wirnnservice.config import Config, get_config
 
 
-@pytest_asyncio.fixture
-async def app() -> AsyncIterator[FastAPI]:
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Run every async test in the session-scoped event loop.
+
+    The ``app`` and ``client`` fixtures are session-scoped, so the tests that
+    use them must share their event loop.
+    """
+    session_scope_marker = pytest.mark.asyncio(scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_scope_marker, append=False)
+
+
+@pytest.fixture(scope="session")
+def test_config() -> Config:
+    """Return the configuration injected into the test application.
+
+    The name differs from the default so that tests can tell whether the
+    handlers are reading the injected configuration.
+    """
+    return Config.for_test(name="wirnn-service-test")
+
+
+@pytest_asyncio.fixture(scope="session")
+async def app(test_config: Config) -> AsyncIterator[FastAPI]:
     """Return a configured test application.
 
     Wraps the application in a lifespan manager so that startup and shutdown
-    events are sent during test execution.
+    events are sent during test execution. The application is started once
+    and shared by every test in the session. Handlers that take their
+    configuration from the ``get_config`` dependency see ``test_config``.
+    The routes and logging are still set up from the environment when
+    `wirnnservice.main` is imported.
     """
+    main.app.dependency_overrides[get_config] = lambda: test_config
     async with LifespanManager(main.app):
         yield main.app
+    main.app.dependency_overrides.pop(get_config)
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="session")
 async def client(app: FastAPI) -> AsyncIterator[AsyncClient]:
-    """Return an ``httpx.AsyncClient`` configured to talk to the test app."""
-    async with AsyncClient(app=app, base_url="https://example.com/") as client:
+    """Return an ``httpx.AsyncClient`` configured to talk to the test app.
+
+    The client is shared across the test session, so tests must not change
+    its state (headers, cookies, and so forth).
+    """
+    transport = ASGITransport(app=app)
+    async with AsyncClient(
+        transport=transport, base_url="https://example.com/"
+    ) as client:
         yield client
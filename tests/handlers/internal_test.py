@@ -5,16 +5,16 @@ from __future__ import annotations
 import pytest
 from httpx import AsyncClient
 
-from wirnnservice.config import config
+from wirnnservice.config import Config
 
 
 @pytest.mark.asyncio
-async def test_get_index(client: AsyncClient) -> None:
+async def test_get_index(client: AsyncClient, test_config: Config) -> None:
     """Test ``GET /``."""
     response = await client.get("/")
     assert response.status_code == 200
     data = response.json()
-    assert data["name"] == config.name
+    assert data["name"] == test_config.name
     assert isinstance(data["version"], str)
     assert isinstance(data["description"], str)
     assert isinstance(data["repository_url"], str)